@@ -5,10 +5,8 @@ from typing import List, Optional
 
 import typer
 from pydantic import ValidationError
-from rich.logging import RichHandler
 
 from .settings import AppSettings
-from .extractor import DependencyExtractor
 import commentjson as json
 
 def setup_logging(log_level: str):
@@ -16,6 +14,10 @@ def setup_logging(log_level: str):
     [EN] Configures the application's logger.
     [PT-BR] Configura o logger da aplicação.
     """
+    # [EN] Imported here so --help and argument errors do not pay the rich import cost.
+    # [PT-BR] Importado aqui para que --help e erros de argumento não paguem o custo de importar o rich.
+    from rich.logging import RichHandler
+
     logging.basicConfig(
         level=log_level.upper(),
         format='%(message)s',
@@ -34,6 +36,8 @@ def main(
     ignore_file: Optional[List[str]] = typer.Option(None, "--ignore-file", help="[EN] File name/pattern to ignore. / [PT-BR] Nome/padrão de arquivo para ignorar."),
     output_dir: Optional[Path] = typer.Option(None, "-o", "--output-dir", help="[EN] Destination directory. / [PT-BR] Diretório de destino."),
     zip_file: Optional[Path] = typer.Option(None, "-z", "--zip", help="[EN] Create a zip file. / [PT-BR] Cria um arquivo zip."),
+    compress_level: Optional[int] = typer.Option(None, "--compress-level", help="[EN] Zip compression level (0-9, default 1). / [PT-BR] Nível de compressão do zip (0-9, padrão 1)."),
+    no_compress: Optional[bool] = typer.Option(None, "--no-compress", help="[EN] Store zip members without compression. / [PT-BR] Armazena os membros do zip sem compressão."),
     config: Optional[Path] = typer.Option(None, "-c", "--config", help="[EN] Path to a JSON configuration file. / [PT-BR] Caminho para um arquivo de configuração JSON."),
     no_recursion: Optional[bool] = typer.Option(None, "--no-recursion", help="[EN] Extract direct dependencies only (level 1). / [PT-BR] Extrai apenas as dependências diretas (nível 1)."),
     log_level: Optional[str] = typer.Option(None, "--log-level", help="[EN] Set the log level, overrides JSON config. / [PT-BR] Define o nível de log, sobrescreve a config JSON."),
@@ -77,6 +81,8 @@ def main(
         "ignore_files": ignore_file or config_data.get("ignore_files", []),
         "output_dir": output_dir or config_data.get("output_dir"),
         "zip_file": zip_file or config_data.get("zip_file"),
+        "compress_level": compress_level if compress_level is not None else config_data.get("compress_level", 1),
+        "no_compress": no_compress if no_compress is not None else config_data.get("no_compress", False),
         "no_recursion": no_recursion if no_recursion is not None else config_data.get("no_recursion", False),
         "log_level": final_log_level,
         "verbose": is_verbose,
@@ -94,6 +100,12 @@ def main(
         raise typer.Exit()
         
     try:
+        # [EN] Deferred import: the extractor pulls in concurrent.futures, rich.progress and the parsers,
+        #      which the help/validation-error paths never need.
+        # [PT-BR] Import adiado: o extrator carrega concurrent.futures, rich.progress e os parsers,
+        #         que os caminhos de ajuda/erro de validação nunca precisam.
+        from .extractor import DependencyExtractor
+
         extractor = DependencyExtractor(settings)
         extractor.run()
     except Exception as e:
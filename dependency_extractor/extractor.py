@@ -1,9 +1,12 @@
 import concurrent.futures
+import fnmatch
 import logging
+import os
 import re
 from collections import deque
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, List, Set, Tuple
+from xml.etree.ElementTree import ParseError, iterparse
 
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 
@@ -15,29 +18,83 @@ from .report import ReportGenerator
 
 log = logging.getLogger("rich")
 
+# [EN] Compiled once at import time instead of on every run.
+# [PT-BR] Compilado uma única vez na importação em vez de a cada execução.
+_PACKAGE_REFERENCE_RE = re.compile(rb'<PackageReference\s+Include="([^"]+)"\s+Version="([^"]+)"', re.IGNORECASE)
+
+# [EN] Below this many files, process spawn overhead outweighs the parallel speedup.
+# [PT-BR] Abaixo desta quantidade de arquivos, o custo de criar processos supera o ganho do paralelismo.
+_PROCESS_POOL_MIN_FILES = 50
+
+# [EN] Upper bound for file contents kept in memory between the indexing and analysis passes.
+# [PT-BR] Limite superior para conteúdos de arquivo mantidos em memória entre as fases de indexação e análise.
+_CONTENT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# [EN] One INFO summary per this many analyzed files instead of per-file output.
+# [PT-BR] Um resumo INFO a cada esta quantidade de arquivos analisados em vez de saída por arquivo.
+_LOG_EVERY_N_FILES = 500
+
+# [EN] Progress-bar updates are flushed in batches of this size; rich re-renders on every update call.
+# [PT-BR] As atualizações da barra de progresso são enviadas em lotes deste tamanho; o rich re-renderiza a cada chamada.
+_PROGRESS_UPDATE_EVERY = 32
+
 class DependencyExtractor:
     # __init__, _is_ignored, _get_relative_path_str... (código existente sem alterações)
     def __init__(self, settings: AppSettings):
         self.settings = settings
-        self.project_dirs = [p.resolve() for p in self.settings.project_dirs]
+        # [EN] A tuple so it can be passed to the cached module resolver as a hashable key.
+        # [PT-BR] Uma tupla para que possa ser passada ao resolvedor de módulos com cache como chave hasheável.
+        self.project_dirs = tuple(p.resolve() for p in self.settings.project_dirs)
         self.ignore_dirs = set(self.settings.ignore_dirs)
         self.ignore_files = set(self.settings.ignore_files)
+        # [EN] Name-only ignore globs are fused into one compiled regex; patterns with separators keep
+        #      the slower Path.match semantics.
+        # [PT-BR] Globs de ignorar somente por nome são fundidos em um único regex compilado; padrões com
+        #         separadores mantêm a semântica mais lenta de Path.match.
+        name_patterns = [p for p in self.ignore_files if '/' not in p and '\\' not in p]
+        # [EN] Path.match is case-insensitive on Windows; the fused regex must preserve that.
+        # [PT-BR] Path.match não diferencia maiúsculas de minúsculas no Windows; o regex fundido deve preservar isso.
+        name_re_flags = re.IGNORECASE if os.name == 'nt' else 0
+        self._ignore_name_re = re.compile('|'.join(fnmatch.translate(p) for p in name_patterns), name_re_flags) if name_patterns else None
+        self._ignore_path_patterns = [p for p in self.ignore_files if p not in set(name_patterns)]
+        # [EN] String prefixes of the resolved project dirs, for relative-path computation without Path machinery.
+        # [PT-BR] Prefixos em string dos diretórios de projeto resolvidos, para calcular caminhos relativos sem a maquinaria de Path.
+        self._project_prefixes = [str(p) + os.sep for p in self.project_dirs]
         self.files_to_process: deque[Tuple[Path, int]] = deque((p.resolve(), 0) for p in self.settings.source_files)
-        self.files_to_copy: Set[Path] = set()
+        # [EN] Gate at enqueue time so each path enters the queue exactly once.
+        # [PT-BR] Controle no momento de enfileirar para que cada caminho entre na fila exatamente uma vez.
+        self._enqueued: Set[Path] = {path for path, _ in self.files_to_process}
+        # [EN] Single ledger of collected files: maps each one to its relative output path, computed once.
+        # [PT-BR] Registro único dos arquivos coletados: mapeia cada um ao seu caminho relativo de saída, calculado uma vez.
+        self._arcnames: Dict[Path, str] = {}
         self.external_python_deps: Set[str] = set()
         self.external_csharp_deps: Set[str] = set()
         self.csharp_type_to_path_map: Dict[str, Path] = {}
+        self.python_module_to_path_map: Dict[str, Path] = {}
+        # [EN] Bytes kept from the indexing pass so dependency analysis does not re-read the same files.
+        # [PT-BR] Bytes mantidos da fase de indexação para que a análise de dependências não releia os mesmos arquivos.
+        self._content_cache: Dict[Path, bytes] = {}
         self.is_csharp_project = any(p.suffix.lower() == '.cs' for p in self.settings.source_files)
+        self.is_python_project = any(p.suffix.lower() == '.py' for p in self.settings.source_files)
         log.debug(f"[EN] Extractor initialized with settings: {settings.model_dump_json(indent=2)} / [PT-BR] Extrator inicializado com as configurações: {settings.model_dump_json(indent=2)}")
 
     def _is_ignored(self, path: Path) -> bool:
-        for part in path.parts:
-            if part in self.ignore_dirs:
-                log.debug(f"[EN] Ignoring '{path}' because directory '{part}' is in ignore list. / [PT-BR] Ignorando '{path}' porque o diretório '{part}' está na lista de ignorados.")
-                return True
-        for pattern in self.ignore_files:
+        # [EN] isEnabledFor guards keep the f-string formatting out of the hot path at INFO level.
+        # [PT-BR] As proteções com isEnabledFor mantêm a formatação das f-strings fora do caminho quente no nível INFO.
+        # [EN] set.isdisjoint short-circuits in C, replacing the per-part Python loop.
+        # [PT-BR] set.isdisjoint interrompe cedo em C, substituindo o laço Python por componente.
+        if self.ignore_dirs and not self.ignore_dirs.isdisjoint(path.parts):
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"[EN] Ignoring '{path}' because one of its directories is in the ignore list. / [PT-BR] Ignorando '{path}' porque um de seus diretórios está na lista de ignorados.")
+            return True
+        if self._ignore_name_re is not None and self._ignore_name_re.match(path.name):
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"[EN] Ignoring '{path}' because it matches an ignore-file pattern. / [PT-BR] Ignorando '{path}' porque corresponde a um padrão de arquivo ignorado.")
+            return True
+        for pattern in self._ignore_path_patterns:
             if path.match(pattern):
-                log.debug(f"[EN] Ignoring '{path}' because it matches file pattern '{pattern}'. / [PT-BR] Ignorando '{path}' porque corresponde ao padrão de arquivo '{pattern}'.")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"[EN] Ignoring '{path}' because it matches file pattern '{pattern}'. / [PT-BR] Ignorando '{path}' porque corresponde ao padrão de arquivo '{pattern}'.")
                 return True
         return False
 
@@ -47,116 +104,243 @@ class DependencyExtractor:
         [PT-BR] Executa todo o processo de extração.
         """
         log.info("[EN] Starting extraction process... / [PT-BR] Iniciando processo de extração...")
+        # [EN] One directory walk feeds the type index, the module index and the .csproj scan.
+        # [PT-BR] Uma única varredura de diretórios alimenta o índice de tipos, o índice de módulos e a análise de .csproj.
+        cs_files, csproj_files, py_files = self._walk_project()
         if self.is_csharp_project:
-            self._build_csharp_type_index()
-        
+            self._build_csharp_type_index(cs_files)
+        if self.is_python_project:
+            self._build_python_module_index(py_files)
+
         self._collect_local_dependencies()
-        self._collect_external_csharp_dependencies()
+        self._collect_external_csharp_dependencies(csproj_files)
 
-        if not self.files_to_copy:
+        if not self._arcnames:
             log.warning("[EN] No local source files found or collected. Halting output generation. / [PT-BR] Nenhum arquivo de código-fonte local foi encontrado ou coletado. Interrompendo a geração de saída.")
             return
 
         report_content = None
         if self.settings.generate_report:
             log.info("[EN] Generating summary report... / [PT-BR] Gerando relatório resumido...")
-            reporter = ReportGenerator(self.settings, self.files_to_copy, self.external_python_deps, self.external_csharp_deps)
+            reporter = ReportGenerator(self.settings, set(self._arcnames), self.external_python_deps, self.external_csharp_deps)
             report_content = reporter.generate_markdown()
 
         if self.settings.output_dir:
-            copy_files_to_dir(self.settings.output_dir, self.files_to_copy, self._get_relative_path_str, self.external_python_deps, self.external_csharp_deps, report_content)
-        
+            copy_files_to_dir(self.settings.output_dir, self._arcnames, self.external_python_deps, self.external_csharp_deps, report_content)
+
         if self.settings.zip_file:
-            create_zip_archive(self.settings.zip_file, self.files_to_copy, self._get_relative_path_str, self.external_python_deps, self.external_csharp_deps, report_content)
+            create_zip_archive(self.settings.zip_file, self._arcnames, self.external_python_deps, self.external_csharp_deps, report_content,
+                               compress_level=self.settings.compress_level, no_compress=self.settings.no_compress)
 
         log.info("[EN] Extraction process completed successfully. / [PT-BR] Processo de extração concluído com sucesso.")
 
-    def _build_csharp_type_index(self) -> None:
+    def _walk_project(self) -> Tuple[List[Path], List[Path], List[Path]]:
+        """
+        [EN] Walks all project directories in a single pass, collecting .cs, .csproj and .py files together.
+        [PT-BR] Percorre todos os diretórios de projeto em uma única passagem, coletando arquivos .cs, .csproj e .py juntos.
+        """
+        cs_files: List[Path] = []
+        csproj_files: List[Path] = []
+        py_files: List[Path] = []
+        # [EN] Reversed so the stack pops project directories in their configured order.
+        # [PT-BR] Invertido para que a pilha desempilhe os diretórios de projeto na ordem configurada.
+        stack = [str(proj_dir) for proj_dir in reversed(self.project_dirs)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # [EN] Pruning ignored directories here skips entire bin/obj/node_modules trees
+                            #      instead of scanning them and discarding their files afterwards.
+                            # [PT-BR] Podar diretórios ignorados aqui pula árvores inteiras de bin/obj/node_modules
+                            #         em vez de varrê-las e descartar seus arquivos depois.
+                            if entry.name not in self.ignore_dirs:
+                                stack.append(entry.path)
+                            continue
+                        name = entry.name.lower()
+                        if name.endswith('.cs'):
+                            cs_files.append(Path(entry.path))
+                        elif name.endswith('.csproj'):
+                            csproj_files.append(Path(entry.path))
+                        elif name.endswith('.py'):
+                            py_files.append(Path(entry.path))
+            except OSError as e:
+                log.warning(f"[EN] Could not scan directory '{directory}': {e} / [PT-BR] Não foi possível varrer o diretório '{directory}': {e}")
+        return cs_files, csproj_files, py_files
+
+    def _build_python_module_index(self, py_files: List[Path]) -> None:
+        """
+        [EN] Maps dotted Python module names to file paths so imports resolve without filesystem calls.
+        [PT-BR] Mapeia nomes de módulos Python com pontos para caminhos de arquivo para que imports resolvam sem chamadas ao sistema de arquivos.
+        """
+        log.info("[EN] Indexing Python project modules... / [PT-BR] Indexando módulos do projeto Python...")
+        # [EN] Ignored files stay in the index on purpose: resolution must still find them so the
+        #      downstream is_ignored check can drop them instead of misreading them as external packages.
+        # [PT-BR] Arquivos ignorados permanecem no índice de propósito: a resolução ainda precisa
+        #         encontrá-los para que a verificação is_ignored posterior os descarte em vez de
+        #         interpretá-los erroneamente como pacotes externos.
+        for py_file in py_files:
+            for proj_dir in self.project_dirs:
+                if py_file.is_relative_to(proj_dir):
+                    parts = py_file.relative_to(proj_dir).with_suffix('').parts
+                    if parts[-1] == '__init__':
+                        parts = parts[:-1]
+                    if parts:
+                        # [EN] First match wins, mirroring the project_dirs search order of resolve_python_module.
+                        # [PT-BR] A primeira correspondência vence, espelhando a ordem de busca de project_dirs de resolve_python_module.
+                        self.python_module_to_path_map.setdefault('.'.join(parts), py_file)
+                    break
+        log.info(f"[EN] Indexing complete. Found {len(self.python_module_to_path_map)} Python modules. / [PT-BR] Indexação completa. Encontrados {len(self.python_module_to_path_map)} módulos Python.")
+
+    def _build_csharp_type_index(self, cs_files: List[Path]) -> None:
         """
-        [EN] Indexes all C# types in the project directories using multiple threads.
-        [PT-BR] Indexa todos os tipos C# nos diretórios do projeto usando múltiplas threads.
+        [EN] Indexes all C# types in the project directories using multiple processes.
+        [PT-BR] Indexa todos os tipos C# nos diretórios do projeto usando múltiplos processos.
         """
         log.info("[EN] Indexing C# project files... / [PT-BR] Indexando arquivos de projeto C#...")
-        all_cs_files = [cs_file for proj_dir in self.project_dirs for cs_file in proj_dir.rglob('*.cs') if not self._is_ignored(cs_file)]
-        
+        all_cs_files = [cs_file for cs_file in cs_files if not self._is_ignored(cs_file)]
+
+        # [EN] The regex scan is CPU-bound, so processes scale across cores where threads would serialize on the GIL.
+        # [PT-BR] A varredura por regex é limitada por CPU, então processos escalam entre núcleos onde threads serializariam no GIL.
+        if len(all_cs_files) >= _PROCESS_POOL_MIN_FILES:
+            executor_cls = concurrent.futures.ProcessPoolExecutor
+            chunksize = max(1, len(all_cs_files) // ((os.cpu_count() or 1) * 4))
+        else:
+            executor_cls = concurrent.futures.ThreadPoolExecutor
+            chunksize = 1
+
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), BarColumn(), TextColumn("[progress.percentage]{task.percentage:>3.0f}%")) as progress:
             task = progress.add_task("[EN] Indexing... / [PT-BR] Indexando...", total=len(all_cs_files))
-            
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = {executor.submit(index_single_csharp_file, file): file for file in all_cs_files}
-                for future in concurrent.futures.as_completed(futures):
-                    file_results = future.result()
-                    for type_name, file_path in file_results:
+
+            cached_bytes = 0
+            with executor_cls() as executor:
+                for found_types, content in executor.map(index_single_csharp_file, all_cs_files, chunksize=chunksize):
+                    for type_name, file_path in found_types:
                         if type_name not in self.csharp_type_to_path_map:
                             self.csharp_type_to_path_map[type_name] = file_path
+                    if content is not None and cached_bytes + len(content) <= _CONTENT_CACHE_MAX_BYTES:
+                        self._content_cache[found_types[0][1]] = content
+                        cached_bytes += len(content)
                     progress.update(task, advance=1)
-        
+
         log.info(f"[EN] Indexing complete. Found {len(self.csharp_type_to_path_map)} unique C# types. / [PT-BR] Indexação completa. Encontrados {len(self.csharp_type_to_path_map)} tipos C# únicos.")
 
+    def _analyze_file(self, file_path: Path) -> Tuple[Set[Path], Set[str]]:
+        """
+        [EN] Parses a single file and returns its local dependencies and external Python dependencies.
+        [PT-BR] Analisa um único arquivo e retorna suas dependências locais e dependências Python externas.
+        """
+        try:
+            content = self._content_cache.pop(file_path, None)
+            if content is None:
+                content = file_path.read_bytes()
+            if file_path.suffix.lower() == '.py':
+                module_index = self.python_module_to_path_map if self.is_python_project else None
+                return parse_python_dependencies(content, self.project_dirs, self._is_ignored, module_index)
+            if file_path.suffix.lower() == '.cs':
+                return parse_csharp_dependencies(content, self.csharp_type_to_path_map, self._is_ignored), set()
+        except Exception as e:
+            log.warning(f"[EN] Could not parse {file_path.name}: {e} / [PT-BR] Não foi possível analisar {file_path.name}: {e}")
+        return set(), set()
+
     def _collect_local_dependencies(self) -> None:
         """
-        [EN] Recursively analyzes the file queue to find all local dependencies.
-        [PT-BR] Analisa recursivamente a fila de arquivos para encontrar todas as dependências locais.
+        [EN] Walks the dependency graph with a future-driven scheduler: new files are submitted for parsing
+             as soon as they are discovered, so workers never wait for a depth level to finish.
+        [PT-BR] Percorre o grafo de dependências com um agendador orientado a futures: novos arquivos são
+                enviados para análise assim que são descobertos, então os workers nunca esperam um nível
+                de profundidade terminar.
         """
         log.info("[EN] Starting analysis of local dependencies... / [PT-BR] Iniciando análise de dependências locais...")
-        processed_files: Set[Path] = set()
+        analyzed_count = 0
 
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), BarColumn(), TextColumn("({task.completed} of {task.total} files)")) as progress:
             task = progress.add_task("[EN] Analyzing... / [PT-BR] Analisando...", total=len(self.files_to_process))
-            
-            while self.files_to_process:
-                current_file, current_depth = self.files_to_process.popleft()
-                progress.update(task, description=f"[EN] Analyzing: {current_file.name} / [PT-BR] Analisando: {current_file.name}")
 
-                if current_file in processed_files or self._is_ignored(current_file):
-                    progress.update(task, advance=1)
-                    continue
-                
-                processed_files.add(current_file)
-                self.files_to_copy.add(current_file)
-                log.debug(f"[EN]   Analyzing (depth {current_depth}): {self._get_relative_path_str(current_file)} / [PT-BR]   Analisando (nível {current_depth}): {self._get_relative_path_str(current_file)}")
-
-                if self.settings.no_recursion and current_depth >= 1:
-                    log.debug(f"[EN] Stopping recursion at depth {current_depth}. / [PT-BR] Parando a recursão no nível {current_depth}.")
-                    progress.update(task, advance=1)
-                    continue
-
-                try:
-                    content = current_file.read_text(encoding='utf-8', errors='ignore')
-                    new_deps: Set[Path] = set()
-                    if current_file.suffix.lower() == '.py':
-                        local_deps, ext_deps = parse_python_dependencies(content, self.project_dirs, self._is_ignored)
-                        new_deps.update(local_deps)
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                pending: Dict[concurrent.futures.Future, Tuple[Path, int]] = {}
+
+                # [EN] Each progress.update triggers a terminal re-render; amortize the cost by
+                #      accumulating completions and flushing advance+total in one call per batch.
+                # [PT-BR] Cada progress.update dispara uma re-renderização do terminal; amortiza o
+                #         custo acumulando conclusões e enviando advance+total em uma chamada por lote.
+                pending_advance = 0
+
+                def note_progress() -> None:
+                    nonlocal pending_advance
+                    pending_advance += 1
+                    if pending_advance >= _PROGRESS_UPDATE_EVERY:
+                        progress.update(task, advance=pending_advance, total=len(self._enqueued))
+                        pending_advance = 0
+
+                def submit_candidate(candidate: Path, depth: int) -> None:
+                    if self._is_ignored(candidate):
+                        note_progress()
+                        return
+
+                    self._arcnames[candidate] = self._get_relative_path_str(candidate)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(f"[EN]   Analyzing (depth {depth}): {self._arcnames[candidate]} / [PT-BR]   Analisando (nível {depth}): {self._arcnames[candidate]}")
+
+                    if self.settings.no_recursion and depth >= 1:
+                        log.debug(f"[EN] Stopping recursion at depth {depth}. / [PT-BR] Parando a recursão no nível {depth}.")
+                        note_progress()
+                        return
+
+                    pending[executor.submit(self._analyze_file, candidate)] = (candidate, depth)
+
+                while self.files_to_process:
+                    submit_candidate(*self.files_to_process.popleft())
+
+                while pending:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        current_file, current_depth = pending.pop(future)
+                        local_deps, ext_deps = future.result()
                         self.external_python_deps.update(ext_deps)
-                    elif current_file.suffix.lower() == '.cs':
-                        new_deps.update(parse_csharp_dependencies(content, self.csharp_type_to_path_map, self._is_ignored))
-                    
-                    for dep_path in new_deps:
-                        if dep_path not in processed_files and dep_path not in [item[0] for item in self.files_to_process]:
-                            self.files_to_process.append((dep_path, current_depth + 1))
-                    
-                    progress.update(task, total=len(processed_files) + len(self.files_to_process))
-                except Exception as e:
-                    log.warning(f"[EN] Could not parse {current_file.name}: {e} / [PT-BR] Não foi possível analisar {current_file.name}: {e}")
-                
-                progress.update(task, advance=1)
-    
+                        for dep_path in local_deps:
+                            if dep_path not in self._enqueued:
+                                self._enqueued.add(dep_path)
+                                submit_candidate(dep_path, current_depth + 1)
+                        analyzed_count += 1
+                        if analyzed_count % _LOG_EVERY_N_FILES == 0:
+                            log.info(f"[EN] Analyzed {analyzed_count} of {len(self._enqueued)} files... / [PT-BR] Analisados {analyzed_count} de {len(self._enqueued)} arquivos...")
+                        note_progress()
+
+                # [EN] Final flush so the bar lands exactly on the discovered total.
+                # [PT-BR] Descarga final para que a barra termine exatamente no total descoberto.
+                progress.update(task, advance=pending_advance, total=len(self._enqueued))
+
+
     def _get_relative_path_str(self, file_path: Path) -> str:
-        for proj_dir in self.project_dirs:
-            if file_path.is_relative_to(proj_dir):
-                return str(file_path.relative_to(proj_dir))
-        return str(file_path)
+        # [EN] A startswith/slice over precomputed prefixes replaces per-call is_relative_to/relative_to.
+        # [PT-BR] Um startswith/fatia sobre prefixos pré-calculados substitui is_relative_to/relative_to por chamada.
+        path_str = str(file_path)
+        for prefix in self._project_prefixes:
+            if path_str.startswith(prefix):
+                return path_str[len(prefix):]
+        return path_str
 
-    def _collect_external_csharp_dependencies(self) -> None:
+    def _collect_external_csharp_dependencies(self, csproj_files: List[Path]) -> None:
         if not self.is_csharp_project: return
         log.info("[EN] Scanning for external dependencies in .csproj files... / [PT-BR] Procurando por dependências externas em arquivos .csproj...")
-        pattern = re.compile(r'<PackageReference\s+Include="([^"]+)"\s+Version="([^"]+)"', re.IGNORECASE)
-        
-        for proj_dir in self.project_dirs:
-            for csproj_file in proj_dir.rglob('*.csproj'):
-                if self._is_ignored(csproj_file): continue
-                log.debug(f"[EN] Analyzing project file: '{csproj_file.name}' / [PT-BR] Analisando arquivo de projeto: '{csproj_file.name}'")
-                content = csproj_file.read_text(encoding='utf-8')
-                for match in pattern.finditer(content):
-                    package, version = match.groups()
+        for csproj_file in csproj_files:
+            if self._is_ignored(csproj_file): continue
+            log.debug(f"[EN] Analyzing project file: '{csproj_file.name}' / [PT-BR] Analisando arquivo de projeto: '{csproj_file.name}'")
+            try:
+                # [EN] Streaming XML parse with the C-coded expat parser; elem.clear() keeps memory bounded.
+                # [PT-BR] Análise de XML em streaming com o parser expat em C; elem.clear() mantém a memória limitada.
+                for _event, element in iterparse(str(csproj_file)):
+                    if element.tag.rpartition('}')[2] == 'PackageReference':
+                        package = element.get('Include')
+                        version = element.get('Version')
+                        if package and version:
+                            self.external_csharp_deps.add(f"{package}=={version}")
+                    element.clear()
+            except ParseError:
+                # [EN] Malformed project files keep the tolerant regex scan.
+                # [PT-BR] Arquivos de projeto malformados mantêm a varredura tolerante por regex.
+                for match in _PACKAGE_REFERENCE_RE.finditer(csproj_file.read_bytes()):
+                    package, version = (g.decode('utf-8', 'replace') for g in match.groups())
                     self.external_csharp_deps.add(f"{package}=={version}")
\ No newline at end of file
@@ -1,7 +1,10 @@
 import ast
+import functools
+import os
 import re
+import threading
 from pathlib import Path
-from typing import List, Set, Tuple, Optional, Callable
+from typing import Dict, List, Set, Tuple, Optional, Callable
 
 try:
     from sys import stdlib_module_names
@@ -10,84 +13,355 @@ except ImportError:
     # [PT-BR] Lista parcial para compatibilidade com Python < 3.10
     stdlib_module_names = {"os", "sys", "re", "collections", "math", "datetime", "json", "typing"}
 
+# [EN] Frozen for cheap hashing in the per-import hot check below.
+# [PT-BR] Congelado para hashing barato na verificação quente por import abaixo.
+_STDLIB_MODULES = frozenset(stdlib_module_names)
 
-def index_single_csharp_file(file_path: Path) -> List[Tuple[str, Path]]:
+# [EN] Patterns compiled once at import time; recompiling them per file is wasted work on large projects.
+# [PT-BR] Padrões compilados uma única vez na importação; recompilá-los por arquivo é trabalho desperdiçado em projetos grandes.
+# [EN] They operate on bytes so files can be scanned without a full UTF-8 decode pass.
+# [PT-BR] Eles operam sobre bytes para que os arquivos possam ser varridos sem uma passagem completa de decodificação UTF-8.
+# [EN] Anchored on the type keyword: the old leading optional modifier groups forced backtracking on every
+#      non-matching line without changing which names were captured. Occasional false positives (e.g. the word
+#      'class' inside a comment) only create index entries that are never looked up.
+# [PT-BR] Ancorado na palavra-chave do tipo: os antigos grupos opcionais de modificadores no início forçavam
+#         backtracking em cada linha sem correspondência, sem mudar quais nomes eram capturados. Falsos positivos
+#         ocasionais (ex.: a palavra 'class' em um comentário) só criam entradas de índice que nunca são consultadas.
+_CS_TYPE_DEF_RE = re.compile(rb'\b(class|interface|enum|struct)\s+([A-Za-z_][A-Za-z0-9_]*)')
+_CS_POTENTIAL_TYPE_RE = re.compile(rb'(?:new\s+|:\s*|typeof\s*\(|<|\[)\s*([A-Z][a-zA-Z0-9_]+)')
+
+try:
+    # [EN] Optional acceleration: Hyperscan's DFA engine scans C# files without regex backtracking.
+    # [PT-BR] Aceleração opcional: o motor DFA do Hyperscan varre arquivos C# sem backtracking de regex.
+    import hyperscan as _hyperscan
+    _HS_POTENTIAL_TYPE_DB = _hyperscan.Database()
+    _HS_POTENTIAL_TYPE_DB.compile(expressions=[rb'(?:new\s+|:\s*|typeof\s*\(|<|\[)\s*[A-Z][a-zA-Z0-9_]+'],
+                                  ids=[0], flags=[_hyperscan.HS_FLAG_SOM_LEFTMOST])
+except ImportError:
+    _HS_POTENTIAL_TYPE_DB = None
+
+# [EN] Hyperscan scratch space is not thread-safe; scans are serialized across parser threads.
+# [PT-BR] A área de rascunho do Hyperscan não é thread-safe; varreduras são serializadas entre as threads do parser.
+_HS_SCAN_LOCK = threading.Lock()
+
+try:
+    # [EN] Optional acceleration: a JIT-compiled byte scanner replaces the regex on the hottest C# path.
+    # [PT-BR] Aceleração opcional: um varredor de bytes compilado via JIT substitui o regex no caminho C# mais quente.
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+
+if _np is not None:
+    @_njit(cache=True)
+    def _scan_csharp_type_spans(buf):  # pragma: no cover - compiled
+        """
+        [EN] Emits (start, end) spans of potential type names, mirroring _CS_POTENTIAL_TYPE_RE.
+        [PT-BR] Emite intervalos (início, fim) de possíveis nomes de tipo, espelhando _CS_POTENTIAL_TYPE_RE.
+        """
+        n = buf.shape[0]
+        starts = _np.empty(n // 2 + 1, _np.int64)
+        ends = _np.empty(n // 2 + 1, _np.int64)
+        count = 0
+        i = 0
+        while i < n:
+            c = buf[i]
+            if 65 <= c <= 90:  # [A-Z]
+                j = i + 1
+                while j < n and (48 <= buf[j] <= 57 or 65 <= buf[j] <= 90 or 97 <= buf[j] <= 122 or buf[j] == 95):
+                    j += 1
+                if j > i + 1:
+                    # [EN] Look back over whitespace for the contexts: 'new ', ':', 'typeof(', '<', '['.
+                    # [PT-BR] Olha para trás, pulando espaços, pelos contextos: 'new ', ':', 'typeof(', '<', '['.
+                    k = i - 1
+                    while k >= 0 and (buf[k] == 32 or buf[k] == 9 or buf[k] == 10 or buf[k] == 13):
+                        k -= 1
+                    ok = False
+                    if k >= 0:
+                        p = buf[k]
+                        if p == 60 or p == 91 or p == 58:  # '<' '[' ':'
+                            ok = True
+                        elif p == 40:  # '(' preceded by 'typeof'
+                            m = k - 1
+                            while m >= 0 and (buf[m] == 32 or buf[m] == 9):
+                                m -= 1
+                            ok = (m >= 5 and buf[m - 5] == 116 and buf[m - 4] == 121 and buf[m - 3] == 112
+                                  and buf[m - 2] == 101 and buf[m - 1] == 111 and buf[m] == 102)
+                        elif p == 119 and k <= i - 2:  # 'new' followed by whitespace
+                            ok = k >= 2 and buf[k - 1] == 101 and buf[k - 2] == 110
+                    if ok:
+                        starts[count] = i
+                        ends[count] = j
+                        count += 1
+                i = j
+            else:
+                i += 1
+        return starts, ends, count
+    @_njit(cache=True)
+    def _scan_py_import_line_offsets(buf):  # pragma: no cover - compiled
+        """
+        [EN] Emits offsets of lines whose first token is 'import' or 'from', at any indentation.
+        [PT-BR] Emite posições de linhas cujo primeiro token é 'import' ou 'from', em qualquer indentação.
+        """
+        n = buf.shape[0]
+        offsets = _np.empty(n // 8 + 1, _np.int64)
+        count = 0
+        i = 0
+        while i < n:
+            j = i
+            while j < n and (buf[j] == 32 or buf[j] == 9):
+                j += 1
+            if (j + 6 < n and buf[j] == 105 and buf[j + 1] == 109 and buf[j + 2] == 112 and buf[j + 3] == 111
+                    and buf[j + 4] == 114 and buf[j + 5] == 116 and (buf[j + 6] == 32 or buf[j + 6] == 9)):  # 'import '
+                offsets[count] = j
+                count += 1
+            elif (j + 4 < n and buf[j] == 102 and buf[j + 1] == 114 and buf[j + 2] == 111 and buf[j + 3] == 109
+                    and (buf[j + 4] == 32 or buf[j + 4] == 9)):  # 'from '
+                offsets[count] = j
+                count += 1
+            while j < n and buf[j] != 10:
+                j += 1
+            i = j + 1
+        return offsets, count
+else:
+    _scan_csharp_type_spans = None
+    _scan_py_import_line_offsets = None
+
+
+# [EN] 'import'/'from' following a colon, as in compound one-liner statements.
+# [PT-BR] 'import'/'from' após dois-pontos, como em instruções compostas de uma linha.
+_COMPOUND_IMPORT_RE = re.compile(rb':[ \t]*(?:import|from)\b')
+
+
+def _fast_scan_python_imports(content: bytes) -> Optional[List[str]]:
+    """
+    [EN] Extracts imported module names with the JIT line scanner, or returns None when the file
+         needs the full ast path (scanner unavailable or constructs a line scan cannot see through).
+    [PT-BR] Extrai nomes de módulos importados com o varredor de linhas JIT, ou retorna None quando o
+            arquivo precisa do caminho ast completo (varredor indisponível ou construções que uma
+            varredura por linhas não consegue enxergar).
+    """
+    if _scan_py_import_line_offsets is None:
+        return None
+    # [EN] Triple-quoted strings, semicolons and line continuations can hide or join statements.
+    # [PT-BR] Strings com aspas triplas, pontos e vírgulas e continuações de linha podem esconder ou unir instruções.
+    if b'"""' in content or b"'''" in content or b';' in content or b'\\\n' in content:
+        return None
+    # [EN] Compound one-liners ('try: import x', 'if cond: from y import z') put the import after a
+    #      colon, where the line scanner cannot see it; such files take the ast path.
+    # [PT-BR] Compostos de uma linha ('try: import x', 'if cond: from y import z') colocam o import
+    #         depois de dois-pontos, onde o varredor de linhas não o enxerga; esses arquivos seguem
+    #         o caminho ast.
+    if _COMPOUND_IMPORT_RE.search(content):
+        return None
+    offsets, count = _scan_py_import_line_offsets(_np.frombuffer(content, dtype=_np.uint8))
+    modules: List[str] = []
+    for k in range(count):
+        start = offsets[k]
+        end = content.find(b'\n', start)
+        line = content[start:end if end != -1 else len(content)].decode('utf-8', 'replace')
+        comment = line.find('#')
+        if comment != -1:
+            line = line[:comment]
+        if line.startswith('import'):
+            rest = line[len('import'):]
+            if '(' in rest:
+                return None
+            for part in rest.split(','):
+                name = part.split(' as ')[0].strip()
+                if name:
+                    modules.append(name)
+        else:
+            head, sep, _imported = line.partition(' import ')
+            if not sep:
+                return None
+            # [EN] Leading dots are dropped to mirror how the ast path treats relative imports.
+            # [PT-BR] Pontos iniciais são descartados para espelhar como o caminho ast trata imports relativos.
+            name = head[len('from'):].strip().lstrip('.')
+            if name:
+                modules.append(name)
+    return modules
+
+
+def _extract_potential_type_names(content: bytes) -> Set[str]:
+    """
+    [EN] Collects the unique potential type names referenced in a C# file.
+    [PT-BR] Coleta os nomes de tipo potenciais únicos referenciados em um arquivo C#.
+    """
+    if _HS_POTENTIAL_TYPE_DB is not None:
+        # [EN] Hyperscan reports a match per end offset; keep the longest span per start offset.
+        # [PT-BR] O Hyperscan reporta uma correspondência por posição final; mantém o maior intervalo por posição inicial.
+        spans: Dict[int, int] = {}
+
+        def _on_match(pattern_id, start, end, flags, context):
+            if end > spans.get(start, 0):
+                spans[start] = end
+
+        with _HS_SCAN_LOCK:
+            _HS_POTENTIAL_TYPE_DB.scan(content, match_event_handler=_on_match)
+
+        names: Set[str] = set()
+        for start, end in spans.items():
+            token = content[start:end]
+            # [EN] The identifier begins at the first uppercase byte after the context prefix.
+            # [PT-BR] O identificador começa no primeiro byte maiúsculo após o prefixo de contexto.
+            for index, byte in enumerate(token):
+                if 65 <= byte <= 90:
+                    names.add(token[index:].decode('ascii', 'replace'))
+                    break
+        return names
+    if _scan_csharp_type_spans is not None:
+        buf = _np.frombuffer(content, dtype=_np.uint8)
+        starts, ends, count = _scan_csharp_type_spans(buf)
+        return {content[starts[i]:ends[i]].decode('ascii', 'replace') for i in range(count)}
+    # [EN] findall materializes the captured group in C, skipping per-hit Match objects.
+    # [PT-BR] findall materializa o grupo capturado em C, evitando objetos Match por ocorrência.
+    return {name.decode('ascii', 'replace') for name in _CS_POTENTIAL_TYPE_RE.findall(content)}
+
+
+def index_single_csharp_file(file_path: Path) -> Tuple[List[Tuple[str, Path]], Optional[bytes]]:
     """
     [EN] Extracts type definitions from a single C# file.
     [PT-BR] Extrai definições de tipo de um único arquivo C#.
+
+    [EN] Also returns the file's bytes when it defines types, so the analysis pass can reuse them instead of re-reading the file.
+    [PT-BR] Também retorna os bytes do arquivo quando ele define tipos, para que a fase de análise os reutilize em vez de reler o arquivo.
     """
-    type_def_pattern = re.compile(r'\b(?:public|internal|private|protected)?\s*(?:partial|static|abstract)?\s*(class|interface|enum|struct)\s+([a-zA-Z0-9_]+)')
     found_types = []
+    content = None
     try:
-        content = file_path.read_text(encoding='utf-8')
-        for match in type_def_pattern.finditer(content):
-            type_name = match.group(2)
-            found_types.append((type_name, file_path))
+        data = file_path.read_bytes()
+        for _keyword, raw_name in _CS_TYPE_DEF_RE.findall(data):
+            found_types.append((raw_name.decode('ascii', 'replace'), file_path))
+        if found_types:
+            content = data
     except Exception:
         # [EN] Silently ignore files that cannot be read.
         # [PT-BR] Ignora silenciosamente arquivos que não podem ser lidos.
         pass
-    return found_types
+    return found_types, content
 
 
-def parse_csharp_dependencies(content: str, type_map: dict, is_ignored_func: Callable[[Path], bool]) -> Set[Path]:
+def parse_csharp_dependencies(content: bytes, type_map: dict, is_ignored_func: Callable[[Path], bool]) -> Set[Path]:
     """
     [EN] Finds all referenced local C# types within a file's content.
     [PT-BR] Encontra todos os tipos C# locais referenciados no conteúdo de um arquivo.
     """
     dependencies: Set[Path] = set()
-    potential_type_pattern = re.compile(r'(?:new\s+|:\s*|typeof\s*\(|<|\[)\s*([A-Z][a-zA-Z0-9_]+)')
-    for match in potential_type_pattern.finditer(content):
-        type_name = match.group(1)
-        if type_name in type_map:
-            file_path = type_map[type_name]
-            if not is_ignored_func(file_path):
-                dependencies.add(file_path)
+    type_map_get = type_map.get
+    for type_name in _extract_potential_type_names(content):
+        # [EN] Single dict probe instead of an 'in' check followed by a lookup.
+        # [PT-BR] Uma única consulta ao dict em vez de um 'in' seguido de um acesso.
+        file_path = type_map_get(type_name)
+        if file_path is not None and not is_ignored_func(file_path):
+            dependencies.add(file_path)
     return dependencies
 
 
-def resolve_python_module(name: str, project_dirs: List[Path]) -> Optional[Path]:
+@functools.lru_cache(maxsize=None)
+def resolve_python_module(name: str, project_dirs: Tuple[Path, ...]) -> Optional[Path]:
     """
     [EN] Resolves a Python module name to a file path within any project directory.
     [PT-BR] Resolve um nome de módulo Python para um caminho de arquivo dentro de qualquer diretório do projeto.
+
+    [EN] Cached so each unique module name hits the filesystem only once per run.
+    [PT-BR] Em cache para que cada nome de módulo único toque o sistema de arquivos apenas uma vez por execução.
     """
-    path_str = name.replace('.', '/')
+    # [EN] os.path calls on strings skip the pure-Python Path machinery on this hot lookup.
+    # [PT-BR] Chamadas os.path sobre strings evitam a maquinaria pure-Python de Path nesta consulta quente.
+    path_str = name.replace('.', os.sep)
     for base_dir in project_dirs:
-        potential_file = base_dir / f"{path_str}.py"
-        if potential_file.is_file():
-            return potential_file.resolve()
-        
-        potential_dir = base_dir / path_str
-        if potential_dir.is_dir() and (potential_dir / '__init__.py').is_file():
-            return (potential_dir / '__init__.py').resolve()
+        potential_file = os.path.join(str(base_dir), path_str + '.py')
+        if os.path.isfile(potential_file):
+            return Path(potential_file).resolve()
+
+        potential_init = os.path.join(str(base_dir), path_str, '__init__.py')
+        if os.path.isfile(potential_init):
+            return Path(potential_init).resolve()
     return None
 
-def parse_python_dependencies(content: str, project_dirs: List[Path], is_ignored_func: Callable[[Path], bool]) -> Tuple[Set[Path], Set[str]]:
+# [EN] Statement types whose bodies may contain import statements.
+# [PT-BR] Tipos de instrução cujos corpos podem conter instruções de import.
+_IMPORT_BEARING_NODES = (ast.If, ast.Try, ast.With, ast.AsyncWith, ast.For, ast.AsyncFor,
+                         ast.While, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+                         ast.Match)
+if hasattr(ast, 'TryStar'):
+    # [EN] try/except* statements parse as a distinct node type on Python 3.11+.
+    # [PT-BR] Instruções try/except* são analisadas como um tipo de nó distinto no Python 3.11+.
+    _IMPORT_BEARING_NODES += (ast.TryStar,)
+
+
+def iter_import_nodes(tree: ast.Module):
+    """
+    [EN] Yields all Import/ImportFrom nodes, descending only into statement blocks.
+    [PT-BR] Produz todos os nós Import/ImportFrom, descendo apenas em blocos de instruções.
+    """
+    stack: List[ast.stmt] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif isinstance(node, _IMPORT_BEARING_NODES):
+            stack.extend(getattr(node, 'body', []))
+            stack.extend(getattr(node, 'orelse', []))
+            stack.extend(getattr(node, 'finalbody', []))
+            for handler in getattr(node, 'handlers', []):
+                stack.extend(handler.body)
+            for case_ in getattr(node, 'cases', []):
+                stack.extend(case_.body)
+
+
+def parse_python_dependencies(content: bytes, project_dirs: Tuple[Path, ...], is_ignored_func: Callable[[Path], bool],
+                              module_index: Optional[dict] = None) -> Tuple[Set[Path], Set[str]]:
     """
     [EN] Parses a Python file to find local and external dependencies.
     [PT-BR] Analisa um arquivo Python para encontrar dependências locais e externas.
+
+    [EN] When a prebuilt module index is given, imports resolve via a dict lookup instead of filesystem calls.
+    [PT-BR] Quando um índice de módulos pré-construído é fornecido, imports resolvem via consulta a dict em vez de chamadas ao sistema de arquivos.
     """
     local_deps: Set[Path] = set()
     external_deps: Set[str] = set()
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
-        return local_deps, external_deps
-
-    for node in ast.walk(tree):
-        modules_to_check = []
-        if isinstance(node, ast.Import):
-            modules_to_check.extend(alias.name for alias in node.names)
-        elif isinstance(node, ast.ImportFrom) and node.module:
-            # [EN] Note: Simplified to handle absolute imports for now. Relative import logic can be more complex.
-            # [PT-BR] Nota: Simplificado para lidar com imports absolutos por enquanto. A lógica para imports relativos pode ser mais complexa.
-            modules_to_check.append(node.module)
-
-        for module_name in modules_to_check:
+    module_names = _fast_scan_python_imports(content)
+    if module_names is None:
+        try:
+            # [EN] ast.parse accepts bytes directly and handles the source encoding itself.
+            # [PT-BR] ast.parse aceita bytes diretamente e trata a codificação do fonte por conta própria.
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return local_deps, external_deps
+
+        module_names = []
+        # [EN] Walking only statement blocks touches far fewer nodes than ast.walk over the full tree.
+        # [PT-BR] Percorrer apenas blocos de instruções visita muito menos nós do que ast.walk sobre a árvore inteira.
+        for node in iter_import_nodes(tree):
+            if isinstance(node, ast.Import):
+                module_names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                # [EN] Note: Simplified to handle absolute imports for now. Relative import logic can be more complex.
+                # [PT-BR] Nota: Simplificado para lidar com imports absolutos por enquanto. A lógica para imports relativos pode ser mais complexa.
+                module_names.append(node.module)
+
+    for module_name in module_names:
+        top_level = module_name.partition('.')[0]
+        # [EN] Stdlib imports can never resolve locally; skipping them avoids stat syscalls.
+        # [PT-BR] Imports da stdlib nunca resolvem localmente; pulá-los evita syscalls de stat.
+        if top_level in _STDLIB_MODULES:
+            continue
+        if module_index is not None:
+            resolved_path = module_index.get(module_name)
+            if resolved_path is None:
+                # [EN] An index miss is not proof the module is external: the walk prunes ignored
+                #      directories out of the index, so confirm with the filesystem resolver first.
+                # [PT-BR] Uma ausência no índice não prova que o módulo é externo: a varredura poda
+                #         diretórios ignorados do índice, então confirma primeiro com o resolvedor
+                #         do sistema de arquivos.
+                resolved_path = resolve_python_module(module_name, project_dirs)
+        else:
             resolved_path = resolve_python_module(module_name, project_dirs)
-            if resolved_path:
-                if not is_ignored_func(resolved_path):
-                    local_deps.add(resolved_path)
-            elif module_name.split('.')[0] not in stdlib_module_names:
-                external_deps.add(module_name.split('.')[0])
+        if resolved_path:
+            if not is_ignored_func(resolved_path):
+                local_deps.add(resolved_path)
+        else:
+            external_deps.add(top_level)
     return local_deps, external_deps
\ No newline at end of file
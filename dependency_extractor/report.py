@@ -14,7 +14,6 @@ class ReportGenerator:
         self.files_copied = sorted(list(files_copied))
         self.py_deps = sorted(list(py_deps))
         self.cs_deps = sorted(list(cs_deps))
-        self.report_content = ""
 
     def _get_relative_path_str(self, file_path: Path) -> str:
         """
@@ -32,40 +31,45 @@ class ReportGenerator:
         [PT-BR] Constrói o relatório completo em formato Markdown.
         """
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
+
+        # [EN] Fragments are collected in a list and joined once; repeated += reallocates the whole
+        #      string and turns long file lists into O(N²) work.
+        # [PT-BR] Os fragmentos são acumulados em uma lista e unidos uma única vez; += repetido realoca a
+        #         string inteira e torna listas longas de arquivos um trabalho O(N²).
+        parts: List[str] = []
+
         # --- Header ---
-        self.report_content += "# Dependency Extraction Report\n\n"
-        self.report_content += f"**[EN] Report generated on:** {now} / **[PT-BR] Relatório gerado em:** {now}\n\n"
+        parts.append("# Dependency Extraction Report\n\n")
+        parts.append(f"**[EN] Report generated on:** {now} / **[PT-BR] Relatório gerado em:** {now}\n\n")
 
         # --- Summary ---
-        self.report_content += "## [EN] Summary / [PT-BR] Resumo\n\n"
-        self.report_content += f"- **[EN] Source Files / [PT-BR] Arquivos de Origem:** `{[str(p.name) for p in self.settings.source_files]}`\n"
-        self.report_content += f"- **[EN] Total Files Copied / [PT-BR] Total de Arquivos Copiados:** `{len(self.files_copied)}`\n"
-        self.report_content += f"- **[EN] Python Dependencies Found / [PT-BR] Dependências Python Encontradas:** `{len(self.py_deps)}`\n"
-        self.report_content += f"- **[EN] C# Dependencies Found / [PT-BR] Dependências C# Encontradas:** `{len(self.cs_deps)}`\n"
+        parts.append("## [EN] Summary / [PT-BR] Resumo\n\n")
+        parts.append(f"- **[EN] Source Files / [PT-BR] Arquivos de Origem:** `{[str(p.name) for p in self.settings.source_files]}`\n")
+        parts.append(f"- **[EN] Total Files Copied / [PT-BR] Total de Arquivos Copiados:** `{len(self.files_copied)}`\n")
+        parts.append(f"- **[EN] Python Dependencies Found / [PT-BR] Dependências Python Encontradas:** `{len(self.py_deps)}`\n")
+        parts.append(f"- **[EN] C# Dependencies Found / [PT-BR] Dependências C# Encontradas:** `{len(self.cs_deps)}`\n")
 
         # --- Copied Files ---
-        self.report_content += "\n## [EN] Extracted Files / [PT-BR] Arquivos Extraídos\n\n"
+        parts.append("\n## [EN] Extracted Files / [PT-BR] Arquivos Extraídos\n\n")
         if self.files_copied:
-            self.report_content += "<details>\n<summary>[EN] Click to expand / [PT-BR] Clique para expandir</summary>\n\n"
-            self.report_content += "```\n"
-            for file_path in self.files_copied:
-                self.report_content += f"- {self._get_relative_path_str(file_path)}\n"
-            self.report_content += "```\n\n</details>\n"
+            parts.append("<details>\n<summary>[EN] Click to expand / [PT-BR] Clique para expandir</summary>\n\n")
+            parts.append("```\n")
+            parts.extend(f"- {self._get_relative_path_str(file_path)}\n" for file_path in self.files_copied)
+            parts.append("```\n\n</details>\n")
         else:
-            self.report_content += "[EN] No files were extracted. / [PT-BR] Nenhum arquivo foi extraído.\n"
+            parts.append("[EN] No files were extracted. / [PT-BR] Nenhum arquivo foi extraído.\n")
 
         # --- External Dependencies ---
-        self.report_content += "\n## [EN] External Dependencies / [PT-BR] Dependências Externas\n\n"
+        parts.append("\n## [EN] External Dependencies / [PT-BR] Dependências Externas\n\n")
         if self.py_deps:
-            self.report_content += "### Python (`requirements.txt`)\n\n```\n"
-            self.report_content += "\n".join(self.py_deps)
-            self.report_content += "\n```\n"
+            parts.append("### Python (`requirements.txt`)\n\n```\n")
+            parts.append("\n".join(self.py_deps))
+            parts.append("\n```\n")
         if self.cs_deps:
-            self.report_content += "### C# (`csharp_packages.txt`)\n\n```\n"
-            self.report_content += "\n".join(self.cs_deps)
-            self.report_content += "\n```\n"
+            parts.append("### C# (`csharp_packages.txt`)\n\n```\n")
+            parts.append("\n".join(self.cs_deps))
+            parts.append("\n```\n")
         if not self.py_deps and not self.cs_deps:
-            self.report_content += "[EN] No external dependencies found. / [PT-BR] Nenhuma dependência externa foi encontrada.\n"
-            
-        return self.report_content
\ No newline at end of file
+            parts.append("[EN] No external dependencies found. / [PT-BR] Nenhuma dependência externa foi encontrada.\n")
+
+        return "".join(parts)
\ No newline at end of file
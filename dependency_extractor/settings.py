@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import List, Optional
-from pydantic import BaseModel, Field, FilePath, DirectoryPath, validator
+from pydantic import BaseModel, Field, FilePath, DirectoryPath, field_validator
 
 class AppSettings(BaseModel):
     """
@@ -13,12 +13,23 @@ class AppSettings(BaseModel):
     ignore_files: List[str] = Field(default_factory=list, description="[EN] File names/patterns to ignore during discovery (e.g., '.DS_Store', '*.log'). / [PT-BR] Nomes/padrões de arquivo a serem ignorados durante a descoberta (ex: '.DS_Store', '*.log').")
     output_dir: Optional[Path] = Field(None, description="[EN] Destination directory for the extracted files. / [PT-BR] Diretório de destino para os arquivos extraídos.")
     zip_file: Optional[Path] = Field(None, description="[EN] Creates a zip archive with the specified name. / [PT-BR] Cria um arquivo zip com o nome especificado.")
+    compress_level: int = Field(1, description="[EN] Zip compression level (0-9). Source files compress well even at 1, which is much faster. / [PT-BR] Nível de compressão do zip (0-9). Arquivos-fonte comprimem bem mesmo em 1, que é muito mais rápido.")
+    no_compress: bool = Field(False, description="[EN] If True, stores zip members uncompressed (ZIP_STORED). / [PT-BR] Se True, armazena os membros do zip sem compressão (ZIP_STORED).")
     no_recursion: bool = Field(False, description="[EN] If True, extracts only the direct dependencies of the source files. / [PT-BR] Se True, extrai apenas as dependências diretas dos arquivos de origem.")
     log_level: str = Field("INFO", description="[EN] Logging level (DEBUG, INFO, WARNING, ERROR). / [PT-BR] Nível de log (DEBUG, INFO, WARNING, ERROR).")
     verbose: bool = Field(False, description="[EN] Enable detailed (DEBUG level) logging. / [PT-BR] Ativa o log detalhado (nível DEBUG).")
     generate_report: bool = Field(True, description="[EN] If True, generates a summary report file. / [PT-BR] Se True, gera um arquivo de relatório resumido.")
 
-    @validator('log_level')
+    @field_validator('compress_level')
+    @classmethod
+    def validate_compress_level(cls, value):
+        if not 0 <= value <= 9:
+            msg = f"[EN] Invalid compression level '{value}'. Must be between 0 and 9. / [PT-BR] Nível de compressão inválido '{value}'. Deve estar entre 0 e 9."
+            raise ValueError(msg)
+        return value
+
+    @field_validator('log_level')
+    @classmethod
     def validate_log_level(cls, value):
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         upper_value = value.upper()